@@ -0,0 +1,87 @@
+# scripts/bench_startup.py
+# Usage: python scripts/bench_startup.py [--repeat 15] [--budget-ms 60]
+#    or: python -m src bench
+#
+# Startup benchmark for the CLI. For each command it times
+# `python -m src <command> --help` against a bare `python -c pass` and checks:
+#   - median overhead over the bare interpreter stays within --budget-ms
+#   - none of the heavy modules in HEAVY_MODULES (pandas, matplotlib, flask,
+#     numpy) get imported
+# Exits 1 if any command is over budget or fails to run, so it can gate CI.
+#
+# `serve` is not measured: it imports Flask up front and is long-running anyway.
+import sys
+import os
+import argparse
+import statistics
+import subprocess
+import time
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+COMMANDS = ["run", "baseline", "summarize", "plot", "generate", "bench"]
+HEAVY_MODULES = ("pandas", "matplotlib", "flask", "numpy")
+
+def time_cmd(args, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(args, cwd=PROJECT_ROOT, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, check=True)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000.0
+
+def heavy_imports(args):
+    """Top-level heavy packages imported, according to -X importtime."""
+    proc = subprocess.run([args[0], "-X", "importtime"] + args[1:], cwd=PROJECT_ROOT,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+                          check=True)
+    found = set()
+    for line in proc.stderr.splitlines():
+        # "import time:   self [us] |  cumulative | imported package"
+        name = line.rsplit("|", 1)[-1].strip()
+        if name.split(".")[0] in HEAVY_MODULES:
+            found.add(name.split(".")[0])
+    return sorted(found)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CLI startup-time benchmark with a budget")
+    parser.add_argument("--repeat", default=15, type=int)
+    parser.add_argument("--budget-ms", default=60.0, type=float,
+                        help="allowed median overhead over a bare interpreter")
+    args = parser.parse_args(argv)
+
+    python = sys.executable
+    base = time_cmd([python, "-c", "pass"], args.repeat)
+    print(f"bare interpreter: {base:.1f} ms (median of {args.repeat})")
+    print(f"{'command':<20} {'median ms':>10} {'overhead':>10}  status")
+
+    failed = 0
+    rows = [("(no command)", [python, "-m", "src", "--help"])]
+    rows += [(name, [python, "-m", "src", name, "--help"]) for name in COMMANDS]
+    for label, cmd in rows:
+        try:
+            ms = time_cmd(cmd, args.repeat)
+            heavy = heavy_imports(cmd)
+        except subprocess.CalledProcessError as e:
+            failed += 1
+            print(f"{label:<20} {'-':>10} {'-':>10}  FAILED (exit {e.returncode})")
+            continue
+        overhead = ms - base
+        status = "ok"
+        if overhead > args.budget_ms:
+            status = f"OVER BUDGET ({args.budget_ms:.0f} ms)"
+        if heavy:
+            status = f"imports {', '.join(heavy)}"
+        if status != "ok":
+            failed += 1
+        print(f"{label:<20} {ms:>10.1f} {overhead:>+10.1f}  {status}")
+
+    if failed:
+        print(f"\n{failed} command(s) failed the startup budget")
+        return 1
+    print("\nAll commands within startup budget")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,38 @@
+# scripts/generate_workload.py
+# Usage: python scripts/generate_workload.py workloads/gen_100k.json results/trace_100k.jsonl.gz
+#        python scripts/generate_workload.py workloads/gen_100k.json out.jsonl --seed 7 --processes 5000
+#    or: python -m src generate <spec> <out> [...]
+import sys
+import os
+import argparse
+import json
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a seeded workload as a replayable trace")
+    parser.add_argument("spec", help="workload JSON with a 'generator' section")
+    parser.add_argument("out", help="trace path (.jsonl or .jsonl.gz)")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--processes", type=int)
+    args = parser.parse_args(argv)
+
+    this_dir = os.path.abspath(os.path.dirname(__file__))
+    project_src = os.path.abspath(os.path.join(this_dir, "..", "src"))
+    if project_src not in sys.path:
+        sys.path.insert(0, project_src)
+    from simulator.workload import generate, write_trace
+
+    with open(args.spec, "r") as f:
+        config = dict(json.load(f)["generator"])
+    if args.seed is not None:
+        config["seed"] = args.seed
+    if args.processes is not None:
+        config["processes"] = args.processes
+
+    out_dir = os.path.dirname(args.out)
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+    n = write_trace(generate(config), args.out)
+    print(f"Wrote {n} processes to:", args.out)
+
+if __name__ == "__main__":
+    main()
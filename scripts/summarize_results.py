@@ -1,6 +1,8 @@
-﻿import sys
+﻿# scripts/summarize_results.py
+# Usage: python scripts/summarize_results.py <csv-file>
+#    or: python -m src summarize <csv-file>
 import os
-import pandas as pd
+import argparse
 from datetime import datetime
 
 def jain_index(values):
@@ -11,35 +13,42 @@ def jain_index(values):
     n = len(values)
     return (s*s) / (n * s2)
 
-if len(sys.argv) < 2:
-    print("Usage: python scripts/summarize_results.py <csv-file>")
-    sys.exit(1)
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-pid CPU share and Jain fairness of a run CSV")
+    parser.add_argument("csv_file")
+    args = parser.parse_args(argv)
 
-csv_file = sys.argv[1]
-df = pd.read_csv(csv_file)
+    # pandas is slow to import; only pay for it once arguments are valid
+    import pandas as pd
 
-last_samples = df.sort_values(["sample_idx"]).groupby("pid").tail(1)
+    csv_file = args.csv_file
+    df = pd.read_csv(csv_file)
 
-totals = last_samples.set_index("pid")["total_cpu"].to_dict()
+    last_samples = df.sort_values(["sample_idx"]).groupby("pid").tail(1)
 
-summary_rows = []
-total_cpu_all = sum(totals.values())
-for pid, tot in totals.items():
-    summary_rows.append({
-        "pid": int(pid),
-        "total_cpu": float(tot),
-        "cpu_share": float(tot) / total_cpu_all if total_cpu_all > 0 else 0.0
-    })
+    totals = last_samples.set_index("pid")["total_cpu"].to_dict()
 
-summary_df = pd.DataFrame(summary_rows).sort_values("pid")
+    summary_rows = []
+    total_cpu_all = sum(totals.values())
+    for pid, tot in totals.items():
+        summary_rows.append({
+            "pid": int(pid),
+            "total_cpu": float(tot),
+            "cpu_share": float(tot) / total_cpu_all if total_cpu_all > 0 else 0.0
+        })
 
-fairness = jain_index(summary_df["total_cpu"].tolist())
+    summary_df = pd.DataFrame(summary_rows).sort_values("pid")
 
-print("\n=== Summary (last sample per pid) ===")
-print(summary_df.to_string(index=False))
-print(f"\nTotal CPU Time = {total_cpu_all:.4f} seconds")
-print(f"Jain Fairness Index = {fairness:.4f}")
+    fairness = jain_index(summary_df["total_cpu"].tolist())
 
-out_path = f"results/summary_{os.path.basename(csv_file).replace('.csv','')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-summary_df.to_csv(out_path, index=False)
-print("\nSummary CSV saved to:", out_path)
+    print("\n=== Summary (last sample per pid) ===")
+    print(summary_df.to_string(index=False))
+    print(f"\nTotal CPU Time = {total_cpu_all:.4f} seconds")
+    print(f"Jain Fairness Index = {fairness:.4f}")
+
+    out_path = f"results/summary_{os.path.basename(csv_file).replace('.csv','')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    summary_df.to_csv(out_path, index=False)
+    print("\nSummary CSV saved to:", out_path)
+
+if __name__ == "__main__":
+    main()
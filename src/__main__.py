@@ -0,0 +1,64 @@
+# src/__main__.py
+# Unified entry point: python -m src <command> [args...]
+#
+# Each command lives in its own script with a main(argv) function; the script is
+# only loaded for the command being run, so e.g. `run` never imports pandas and
+# `summarize --help` returns before pandas is touched.
+
+import sys
+import os
+import importlib.util
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# command -> (script relative to project root, one-line help)
+COMMANDS = {
+    "serve": ("test_server.py", "start the Flask /allocate API"),
+    "run": ("src/controller/run_experiment.py", "adaptive experiment run (CSV to results/)"),
+    "baseline": ("src/controller/run_baseline_rr.py", "plain round-robin baseline run"),
+    "summarize": ("scripts/summarize_results.py", "CPU share + Jain fairness of a run CSV"),
+    "plot": ("scripts/plot_results.py", "plot CPU time and weights of a run CSV"),
+    "generate": ("scripts/generate_workload.py", "write a seeded workload as a replay trace"),
+    "bench": ("scripts/bench_startup.py", "measure CLI startup time against its budget"),
+}
+
+
+def usage():
+    lines = ["usage: python -m src <command> [args...]", "", "commands:"]
+    for name, (_, help_text) in COMMANDS.items():
+        lines.append(f"  {name:<10} {help_text}")
+    lines.append("")
+    lines.append("Run `python -m src <command> --help` for command options.")
+    return "\n".join(lines)
+
+
+def load_command(name):
+    """Import the script behind a command by path (scripts/ is not a package)."""
+    rel_path, _ = COMMANDS[name]
+    path = os.path.join(PROJECT_ROOT, rel_path)
+    spec = importlib.util.spec_from_file_location(f"cli_{name}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ("-h", "--help"):
+        print(usage())
+        return 0
+    name = argv[0]
+    if name not in COMMANDS:
+        print(f"unknown command: {name}\n", file=sys.stderr)
+        print(usage(), file=sys.stderr)
+        return 2
+
+    # so the command's argparse usage reads `python -m src run ...`
+    # (not for serve: Flask's debug reloader re-executes using sys.argv[0])
+    if name != "serve":
+        sys.argv[0] = f"python -m src {name}"
+    return load_command(name).main(argv[1:])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -46,5 +46,13 @@ class HeuristicAllocator:
                 # if currently high weight but using little CPU, keep it
                 pass
 
+    def add_process(self, pid):
+        # newly arrived process starts at the same weight as the initial set
+        self.weights.setdefault(pid, 10)
+
+    def remove_process(self, pid):
+        self.weights.pop(pid, None)
+        self.prev_cpu.pop(pid, None)
+
     def get_weights(self):
         return self.weights
@@ -4,35 +4,16 @@
 import sys
 import os
 import argparse
-import json
 import time
 from datetime import datetime
 import csv
 
-# ensure imports work
-this_dir = os.path.abspath(os.path.dirname(__file__))
-project_src = os.path.abspath(os.path.join(this_dir, ".."))
-if project_src not in sys.path:
-    sys.path.insert(0, project_src)
-
-from simulator.process import SimulatedProcess
-from simulator.scheduler_rr import RoundRobinScheduler
-from monitor.monitor import Monitor
-
-def load_workload(path):
-    with open(path, "r") as f:
-        return json.load(f)
-
-def create_processes(workload):
-    processes = []
-    pid = 1
-    for _ in range(workload.get("cpu_bound", 0)):
-        processes.append(SimulatedProcess(pid, "cpu")); pid += 1
-    for _ in range(workload.get("io_bound", 0)):
-        processes.append(SimulatedProcess(pid, "io")); pid += 1
-    for _ in range(workload.get("mem_bound", 0)):
-        processes.append(SimulatedProcess(pid, "mem")); pid += 1
-    return processes
+def _add_src_to_path():
+    # done lazily (after argument parsing) so `--help` stays cheap
+    this_dir = os.path.abspath(os.path.dirname(__file__))
+    project_src = os.path.abspath(os.path.join(this_dir, ".."))
+    if project_src not in sys.path:
+        sys.path.insert(0, project_src)
 
 def save_csv(rows, filename):
     if not rows:
@@ -44,16 +25,23 @@ def save_csv(rows, filename):
         writer.writeheader()
         writer.writerows(rows)
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser()
     parser.add_argument("--workload", default="workloads/mix1.json")
     parser.add_argument("--duration", default=10, type=int)
     parser.add_argument("--slice", default=0.05, type=float)
     parser.add_argument("--sample-interval", default=0.2, type=float)
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
-    workload = load_workload(args.workload)
-    processes = create_processes(workload)
+    _add_src_to_path()
+    from simulator.scheduler_rr import RoundRobinScheduler
+    from simulator.workload import load_workload, workload_name, WorkloadFeed
+    from monitor.monitor import Monitor
+
+    # specs are streamed; processes are admitted as their arrival time comes up
+    feed = WorkloadFeed(load_workload(args.workload))
+    arrived, _ = feed.advance(0.0)
+    processes = list(arrived)
 
     monitor = Monitor(sample_interval=args.sample_interval)
     scheduler = RoundRobinScheduler(processes, slice_sec=args.slice)
@@ -63,6 +51,15 @@ def main():
     sample_idx = 0
     print(f"Starting RR baseline: duration={args.duration}s, processes={len(processes)}")
     while time.time() - start_time < args.duration:
+        arrived, departed = feed.advance(time.time() - start_time)
+        for p in arrived:
+            scheduler.add(p)
+        for p in departed:
+            scheduler.remove(p.pid)
+            monitor.forget(p.pid)
+        if feed.exhausted():
+            break
+
         pid, used = scheduler.step()
         monitor.sample(processes)  # collects history, sleeps sample_interval
 
@@ -82,8 +79,7 @@ def main():
         sample_idx += 1
 
     stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    workload_name = os.path.splitext(os.path.basename(args.workload))[0]
-    csv_path = f"results/run_rr_{workload_name}_{stamp}.csv"
+    csv_path = f"results/run_rr_{workload_name(args.workload)}_{stamp}.csv"
     save_csv(rows, csv_path)
     print("Done. CSV saved to:", csv_path)
 
@@ -4,36 +4,16 @@
 import sys
 import os
 import argparse
-import json
 import time
 from datetime import datetime
 import csv
 
-# make sure imports work when running as script
-this_dir = os.path.abspath(os.path.dirname(__file__))
-project_src = os.path.abspath(os.path.join(this_dir, ".."))
-if project_src not in sys.path:
-    sys.path.insert(0, project_src)
-
-from simulator.process import SimulatedProcess
-from simulator.scheduler_rr import RoundRobinScheduler
-from monitor.monitor import Monitor
-from allocator.heuristic_allocator import HeuristicAllocator
-
-def load_workload(path):
-    with open(path, "r") as f:
-        return json.load(f)
-
-def create_processes(workload):
-    processes = []
-    pid = 1
-    for _ in range(workload.get("cpu_bound", 0)):
-        processes.append(SimulatedProcess(pid, "cpu")); pid += 1
-    for _ in range(workload.get("io_bound", 0)):
-        processes.append(SimulatedProcess(pid, "io")); pid += 1
-    for _ in range(workload.get("mem_bound", 0)):
-        processes.append(SimulatedProcess(pid, "mem")); pid += 1
-    return processes
+def _add_src_to_path():
+    # done lazily (after argument parsing) so `--help` stays cheap
+    this_dir = os.path.abspath(os.path.dirname(__file__))
+    project_src = os.path.abspath(os.path.join(this_dir, ".."))
+    if project_src not in sys.path:
+        sys.path.insert(0, project_src)
 
 def save_csv(rows, filename):
     # rows: list of dicts (same keys)
@@ -46,16 +26,24 @@ def save_csv(rows, filename):
         writer.writeheader()
         writer.writerows(rows)
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser()
     parser.add_argument("--workload", default="workloads/mix1.json")
     parser.add_argument("--duration", default=10, type=int)
     parser.add_argument("--policy", default="adaptive")
     parser.add_argument("--sample-interval", default=0.2, type=float)
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
-    workload = load_workload(args.workload)
-    processes = create_processes(workload)
+    _add_src_to_path()
+    from simulator.scheduler_rr import RoundRobinScheduler
+    from simulator.workload import load_workload, workload_name, WorkloadFeed
+    from monitor.monitor import Monitor
+    from allocator.heuristic_allocator import HeuristicAllocator
+
+    # specs are streamed; processes are admitted as their arrival time comes up
+    feed = WorkloadFeed(load_workload(args.workload))
+    arrived, _ = feed.advance(0.0)
+    processes = list(arrived)
 
     monitor = Monitor(sample_interval=args.sample_interval)
     allocator = HeuristicAllocator(processes)
@@ -67,6 +55,18 @@ def main():
     sample_idx = 0
     print(f"Starting experiment: policy={args.policy}, duration={args.duration}s, processes={len(processes)}")
     while time.time() - start_time < args.duration:
+        # admit arrivals / retire departures
+        arrived, departed = feed.advance(time.time() - start_time)
+        for p in arrived:
+            scheduler.add(p)
+            allocator.add_process(p.pid)
+        for p in departed:
+            scheduler.remove(p.pid)
+            allocator.remove_process(p.pid)
+            monitor.forget(p.pid)
+        if feed.exhausted():
+            break
+
         # run one step (scheduler.step includes running a process for slice)
         pid, used = scheduler.step()
 
@@ -95,8 +95,7 @@ def main():
 
     # save CSV with timestamped filename
     stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    workload_name = os.path.splitext(os.path.basename(args.workload))[0]
-    csv_path = f"results/run_{args.policy}_{workload_name}_{stamp}.csv"
+    csv_path = f"results/run_{args.policy}_{workload_name(args.workload)}_{stamp}.csv"
     save_csv(rows, csv_path)
 
     print("Done. CSV saved to:", csv_path)
@@ -18,3 +18,7 @@ class Monitor:
             })
 
         time.sleep(self.sample_interval)
+
+    def forget(self, pid):
+        """Release history of a departed process."""
+        self.history.pop(pid, None)
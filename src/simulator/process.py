@@ -2,18 +2,41 @@ import time
 import random
 
 class SimulatedProcess:
-    def __init__(self, pid, kind, cpu_demand=1, mem_demand_mb=10):
+    def __init__(self, pid, kind, cpu_demand=1, mem_demand_mb=10,
+                 arrival=0.0, departure=None, phases=None):
         self.pid = pid            # unique ID
         self.kind = kind          # cpu / io / mem
-        self.cpu_demand = cpu_demand
+        self.cpu_demand = cpu_demand  # slice multiplier, see run_for
         self.mem_demand_mb = mem_demand_mb
 
+        # lifetime relative to experiment start (departure=None -> runs forever)
+        self.arrival = arrival
+        self.departure = departure
+        # phases: list of dicts {"at": secs after arrival, "kind": ..., ...}
+        self.phases = sorted(phases or [], key=lambda ph: ph["at"])
+        self.phase_idx = 0
+
         self.total_cpu_time = 0.0
         self.wait_time = 0.0
         self.completed = False
 
+    def update_phase(self, elapsed):
+        """Switch kind/demands once the process has lived past a phase boundary."""
+        age = elapsed - self.arrival
+        while self.phase_idx < len(self.phases) and self.phases[self.phase_idx]["at"] <= age:
+            phase = self.phases[self.phase_idx]
+            self.kind = phase.get("kind", self.kind)
+            self.cpu_demand = phase.get("cpu_demand", self.cpu_demand)
+            self.mem_demand_mb = phase.get("mem_demand_mb", self.mem_demand_mb)
+            self.phase_idx += 1
+
     def run_for(self, duration_seconds):
-        """Simulate running this process for a time slice."""
+        """
+        Simulate running this process for a time slice.
+        cpu_demand scales the slice: a process demanding 2 runs (and is
+        charged) twice as long per turn as one demanding 1.
+        """
+        duration_seconds = duration_seconds * self.cpu_demand
         start = time.time()
 
         if self.kind == "cpu":
@@ -30,7 +53,7 @@ class SimulatedProcess:
 
         elif self.kind == "mem":
             # Memory-heavy process
-            arr = [0] * (self.mem_demand_mb * 200)
+            arr = [0] * (int(self.mem_demand_mb) * 200)
             time.sleep(duration_seconds * 0.1)
             used = duration_seconds * 0.9
             del arr
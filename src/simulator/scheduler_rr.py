@@ -8,8 +8,27 @@ class RoundRobinScheduler:
         self.slice = slice_sec
         self.index = 0
 
+    def add(self, process):
+        """Admit a newly arrived process at the end of the run queue."""
+        self.processes.append(process)
+
+    def remove(self, pid):
+        """Drop a departed process, keeping the RR position stable."""
+        for i, p in enumerate(self.processes):
+            if p.pid == pid:
+                del self.processes[i]
+                if i < self.index:
+                    self.index -= 1
+                break
+        if self.index >= len(self.processes):
+            self.index = 0
+
     def step(self):
         """Run one scheduling step."""
+        if not self.processes:
+            # nothing has arrived yet (or everything departed)
+            return None, 0.0
+
         p = self.processes[self.index]
 
         used = p.run_for(self.slice)
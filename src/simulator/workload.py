@@ -0,0 +1,267 @@
+# src/simulator/workload.py
+# Workload specs, seeded generator and line-delimited trace replay.
+#
+# A workload is a stream of process specs (plain dicts), ordered by arrival:
+#   {"pid": 7, "kind": "io", "arrival": 1.25, "departure": 9.5,
+#    "cpu_demand": 1, "mem_demand_mb": 10,
+#    "phases": [{"at": 3.0, "kind": "cpu"}]}
+# Only "pid" and "kind" are required; the rest default as in SimulatedProcess
+# (cpu_demand multiplies the scheduler slice, mem_demand_mb sizes the mem buffer).
+#
+# Supported workload files:
+#   *.json      legacy counters {"cpu_bound": 2, "io_bound": 2, "mem_bound": 1}
+#               or {"generator": {...}} (see generate())
+#   *.jsonl     trace, one spec per line (optionally *.jsonl.gz), sorted by arrival
+# Everything is streamed lazily, so traces never have to fit in memory.
+
+import gzip
+import heapq
+import json
+import os
+import random
+
+from .process import SimulatedProcess
+
+KINDS = ("cpu", "io", "mem")
+
+# spec keys written to traces when they differ from these defaults
+SPEC_DEFAULTS = {
+    "arrival": 0.0,
+    "departure": None,
+    "cpu_demand": 1,
+    "mem_demand_mb": 10,
+    "phases": None,
+}
+
+
+def _open_text(path, mode="r"):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def draw(rng, dist):
+    """
+    Sample a value from a distribution spec:
+      5                                   constant
+      {"dist": "uniform", "low": 1, "high": 4}
+      {"dist": "normal", "mean": 10, "std": 2}     (clamped at 0)
+      {"dist": "exp", "mean": 5}
+      {"dist": "choice", "values": [10, 20, 50]}
+    """
+    if not isinstance(dist, dict):
+        return dist
+    kind = dist.get("dist", "const")
+    if kind == "const":
+        return dist["value"]
+    if kind == "uniform":
+        return rng.uniform(dist["low"], dist["high"])
+    if kind == "normal":
+        return max(0.0, rng.gauss(dist["mean"], dist["std"]))
+    if kind == "exp":
+        return rng.expovariate(1.0 / dist["mean"])
+    if kind == "choice":
+        return rng.choice(dist["values"])
+    raise ValueError(f"unknown distribution: {kind}")
+
+
+def _compact(value):
+    # keep traces short: 6 decimals is well below scheduler resolution
+    return round(value, 6) if isinstance(value, float) else value
+
+
+def from_counters(workload):
+    """Legacy mix: all processes arrive at t=0 and never leave."""
+    pid = 1
+    for kind in KINDS:
+        for _ in range(workload.get(f"{kind}_bound", 0)):
+            yield {"pid": pid, "kind": kind}
+            pid += 1
+
+
+def generate(config):
+    """
+    Lazily generate process specs from a seed. config example:
+      {
+        "seed": 42,
+        "processes": 100000,
+        "arrival_rate": 200.0,                 # mean arrivals per second (Poisson)
+        "lifetime": {"dist": "exp", "mean": 5},  # omit -> never depart
+        "kinds": {
+          "cpu": {"weight": 2, "cpu_demand": {"dist": "uniform", "low": 0.5, "high": 2}},
+          "io":  {"weight": 2},
+          "mem": {"weight": 1, "mem_demand_mb": {"dist": "choice", "values": [10, 50]},
+                  "phases": [{"at": {"dist": "exp", "mean": 2}, "kind": "cpu"}]}
+        }
+      }
+    Same config + seed always yields the same stream.
+    """
+    rng = random.Random(config.get("seed", 0))
+    count = int(config.get("processes", 0))
+    rate = float(config.get("arrival_rate", 0.0))
+    lifetime = config.get("lifetime")
+    kinds = config.get("kinds") or {k: {} for k in KINDS}
+
+    names = list(kinds)
+    weights = [kinds[k].get("weight", 1) for k in names]
+
+    t = 0.0
+    for pid in range(1, count + 1):
+        if rate > 0:
+            t += rng.expovariate(rate)
+        kind = rng.choices(names, weights)[0]
+        kcfg = kinds[kind]
+
+        spec = {"pid": pid, "kind": kind, "arrival": _compact(t)}
+        if lifetime is not None:
+            spec["departure"] = _compact(t + draw(rng, lifetime))
+        if "cpu_demand" in kcfg:
+            spec["cpu_demand"] = _compact(draw(rng, kcfg["cpu_demand"]))
+        if "mem_demand_mb" in kcfg:
+            spec["mem_demand_mb"] = _compact(draw(rng, kcfg["mem_demand_mb"]))
+        if kcfg.get("phases"):
+            spec["phases"] = [
+                {key: _compact(draw(rng, val)) for key, val in phase.items()}
+                for phase in kcfg["phases"]
+            ]
+        yield spec
+
+
+class TraceReader:
+    """
+    Streams specs from a line-delimited trace (blank and # lines skipped).
+    `line` is the file line of the last spec returned, for error messages.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.line = 0
+        self._f = None
+        self._done = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._done:
+            raise StopIteration
+        if self._f is None:
+            self._f = _open_text(self.path)
+        for raw in self._f:
+            self.line += 1
+            raw = raw.strip()
+            if not raw or raw.startswith("#"):
+                continue
+            return json.loads(raw)
+        self._f.close()
+        self._done = True
+        raise StopIteration
+
+
+def read_trace(path):
+    return TraceReader(path)
+
+
+def write_trace(specs, path):
+    """Write specs one per line, dropping default fields to keep traces compact."""
+    n = 0
+    with _open_text(path, "w") as f:
+        for spec in specs:
+            compact = {k: v for k, v in spec.items()
+                       if k not in SPEC_DEFAULTS or SPEC_DEFAULTS[k] != v}
+            f.write(json.dumps(compact, separators=(",", ":")))
+            f.write("\n")
+            n += 1
+    return n
+
+
+def load_workload(path):
+    """Return a lazy iterator of process specs for any supported workload file."""
+    if path.endswith(".jsonl") or path.endswith(".jsonl.gz"):
+        return read_trace(path)
+    with open(path, "r") as f:
+        workload = json.load(f)
+    if "generator" in workload:
+        return generate(workload["generator"])
+    return from_counters(workload)
+
+
+def workload_name(path):
+    """Base name for result files: trace_100k.jsonl.gz -> trace_100k."""
+    name = os.path.basename(path)
+    for ext in (".gz", ".jsonl", ".json"):
+        if name.endswith(ext):
+            name = name[:-len(ext)]
+    return name
+
+
+def make_process(spec):
+    return SimulatedProcess(
+        spec["pid"],
+        spec["kind"],
+        cpu_demand=spec.get("cpu_demand", 1),
+        mem_demand_mb=spec.get("mem_demand_mb", 10),
+        arrival=spec.get("arrival", 0.0),
+        departure=spec.get("departure"),
+        phases=spec.get("phases"),
+    )
+
+
+class WorkloadFeed:
+    """
+    Pulls specs from a (possibly huge) stream only as their arrival time comes up.
+    advance(elapsed) -> (arrived, departed) lists of SimulatedProcess.
+    The stream must be sorted by arrival; a spec arriving earlier than the one
+    before it raises ValueError instead of being silently delayed.
+    """
+    def __init__(self, specs):
+        self.specs = iter(specs)
+        self.count = 0          # specs pulled so far
+        self.last_arrival = 0.0
+        self.active = {}        # pid -> process
+        self.departures = []    # heap of (departure, pid)
+        self.pending = self._pull()
+
+    def _pull(self):
+        spec = next(self.specs, None)
+        if spec is None:
+            return None
+        self.count += 1
+        arrival = spec.get("arrival", 0.0)
+        if arrival < self.last_arrival:
+            line = getattr(self.specs, "line", None)
+            where = f"line {line}" if line is not None else f"spec #{self.count}"
+            raise ValueError(
+                f"workload not sorted by arrival: pid {spec.get('pid')} at {where} "
+                f"arrives at {arrival}, before previous arrival {self.last_arrival}"
+            )
+        self.last_arrival = arrival
+        return spec
+
+    def advance(self, elapsed):
+        arrived = []
+        while self.pending is not None and self.pending.get("arrival", 0.0) <= elapsed:
+            p = make_process(self.pending)
+            self.pending = self._pull()
+            if p.departure is not None and p.departure <= elapsed:
+                continue  # arrived and left between two steps
+            self.active[p.pid] = p
+            arrived.append(p)
+            if p.departure is not None:
+                heapq.heappush(self.departures, (p.departure, p.pid))
+
+        departed = []
+        while self.departures and self.departures[0][0] <= elapsed:
+            _, pid = heapq.heappop(self.departures)
+            p = self.active.pop(pid, None)
+            if p is not None:
+                p.completed = True
+                departed.append(p)
+
+        for p in self.active.values():
+            if p.phases:
+                p.update_phase(elapsed)
+
+        return arrived, departed
+
+    def exhausted(self):
+        return self.pending is None and not self.active
@@ -1,32 +1,52 @@
 from flask import Flask, request, jsonify
 from flask_cors import CORS
+import argparse
 import importlib.util
 import os
+import threading
 import traceback
 
 app = Flask(__name__)
 CORS(app)
 
-# Try dynamic import of resource_allocation.py (the file with new functions)
+# resource_allocation.py (the file with new functions) is loaded on the first
+# request rather than at import time, so importing this module stays cheap.
 ALLOCATOR_FN = None
 mod = None
-try:
-    path = os.path.join(os.getcwd(), "resource_allocation.py")
-    if os.path.exists(path):
-        spec = importlib.util.spec_from_file_location("resource_allocation", path)
-        mod = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(mod)
-        # Prefer allocate_respecting_capacities if present
-        if hasattr(mod, "allocate_respecting_capacities"):
-            ALLOCATOR_FN = mod.allocate_respecting_capacities
-        elif hasattr(mod, "adaptive_allocate_fixed"):
-            ALLOCATOR_FN = mod.adaptive_allocate_fixed
-        # else ALLOCATOR_FN remains None
-except Exception:
-    print("Import error while loading resource_allocation.py:")
-    traceback.print_exc()
-    ALLOCATOR_FN = None
-    mod = None
+_allocator_loaded = False
+_allocator_lock = threading.Lock()
+
+
+def load_allocator():
+    """Dynamically import resource_allocation.py once; returns (fn, module)."""
+    global ALLOCATOR_FN, mod, _allocator_loaded
+    if _allocator_loaded:
+        return ALLOCATOR_FN, mod
+    # the dev server is threaded: concurrent first requests wait for one load
+    with _allocator_lock:
+        if _allocator_loaded:
+            return ALLOCATOR_FN, mod
+        fn, module = None, None
+        try:
+            path = os.path.join(os.getcwd(), "resource_allocation.py")
+            if os.path.exists(path):
+                spec = importlib.util.spec_from_file_location("resource_allocation", path)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                # Prefer allocate_respecting_capacities if present
+                if hasattr(module, "allocate_respecting_capacities"):
+                    fn = module.allocate_respecting_capacities
+                elif hasattr(module, "adaptive_allocate_fixed"):
+                    fn = module.adaptive_allocate_fixed
+                # else fn remains None
+        except Exception:
+            print("Import error while loading resource_allocation.py:")
+            traceback.print_exc()
+            fn, module = None, None
+        ALLOCATOR_FN, mod = fn, module
+        # set last, so the unlocked fast path never sees a half-loaded module
+        _allocator_loaded = True
+    return ALLOCATOR_FN, mod
 
 
 @app.route("/allocate", methods=["POST"])
@@ -48,10 +68,11 @@ def allocate_route():
         demands = []
 
     # If allocator function is available, call it
-    if ALLOCATOR_FN:
+    allocator_fn, mod = load_allocator()
+    if allocator_fn:
         try:
-            if ALLOCATOR_FN.__name__ == "allocate_respecting_capacities":
-                result = ALLOCATOR_FN(capacities, demands)
+            if allocator_fn.__name__ == "allocate_respecting_capacities":
+                result = allocator_fn(capacities, demands)
             else:
                 # adaptive_allocate_fixed expects Task/Resource objects; build them
                 # ensure mod is available
@@ -59,7 +80,7 @@ def allocate_route():
                     raise RuntimeError("Allocator module not available")
                 tasks_obj = [mod.Task(f"T{i+1}", d) for i, d in enumerate(demands)]
                 resources_obj = [mod.Resource(f"R{i+1}", c) for i, c in enumerate(capacities)]
-                result = ALLOCATOR_FN(tasks_obj, resources_obj)
+                result = allocator_fn(tasks_obj, resources_obj)
             # result should already be a JSON-serializable dict with keys:
             # "status", "allocations" (flattened), "resource_status", "unallocated"
             return jsonify(result)
@@ -102,13 +123,23 @@ def allocate_route():
     return jsonify({"status": "success", "allocations": flattened, "resource_status": resource_status, "unallocated": []})
 
 
-if __name__ == "__main__":
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the /allocate API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", default=5000, type=int)
+    parser.add_argument("--no-debug", action="store_true", help="disable Flask debug mode/reloader")
+    args = parser.parse_args(argv)
+
     print("Starting test_server.py")
-    print(" - Listening on http://127.0.0.1:5000")
+    print(f" - Listening on http://{args.host}:{args.port}")
     print(" - Make POST requests to /allocate")
     try:
         # debug=True to show stack traces in server console; remove in production
-        app.run(host="127.0.0.1", port=5000, debug=True)
+        app.run(host=args.host, port=args.port, debug=not args.no_debug)
     except Exception:
         print("Failed to start Flask server:")
         traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
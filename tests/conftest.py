@@ -0,0 +1,8 @@
+# tests/conftest.py
+# Same import layout as the runners: modules live under src/ without a package prefix.
+import os
+import sys
+
+project_src = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+if project_src not in sys.path:
+    sys.path.insert(0, project_src)
@@ -0,0 +1,159 @@
+# tests/test_workload.py
+import gzip
+import json
+from itertools import islice
+
+import pytest
+
+from simulator.workload import (
+    WorkloadFeed, generate, load_workload, read_trace, workload_name, write_trace,
+)
+from simulator.scheduler_rr import RoundRobinScheduler
+
+CONFIG = {
+    "seed": 7,
+    "processes": 200,
+    "arrival_rate": 50.0,
+    "lifetime": {"dist": "exp", "mean": 2},
+    "kinds": {
+        "cpu": {"weight": 2, "cpu_demand": {"dist": "uniform", "low": 0.5, "high": 2}},
+        "io": {"weight": 1},
+        "mem": {"weight": 1, "mem_demand_mb": {"dist": "choice", "values": [10, 50]},
+                "phases": [{"at": {"dist": "exp", "mean": 1}, "kind": "cpu"}]},
+    },
+}
+
+
+def test_generate_is_deterministic_per_seed():
+    assert list(generate(CONFIG)) == list(generate(CONFIG))
+    other = dict(CONFIG, seed=8)
+    assert list(generate(CONFIG)) != list(generate(other))
+
+
+def test_generate_is_lazy_and_sorted():
+    huge = dict(CONFIG, processes=10**9)
+    specs = list(islice(generate(huge), 100))
+    arrivals = [s["arrival"] for s in specs]
+    assert arrivals == sorted(arrivals)
+
+
+def test_trace_round_trip_gz_drops_defaults(tmp_path):
+    path = str(tmp_path / "trace.jsonl.gz")
+    specs = [
+        {"pid": 1, "kind": "cpu", "arrival": 0.0, "departure": None,
+         "cpu_demand": 1, "mem_demand_mb": 10, "phases": None},
+        {"pid": 2, "kind": "mem", "arrival": 0.5, "departure": 3.0,
+         "mem_demand_mb": 50, "phases": [{"at": 1.0, "kind": "cpu"}]},
+    ]
+    assert write_trace(specs, path) == 2
+
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        first = json.loads(f.readline())
+    assert first == {"pid": 1, "kind": "cpu"}
+
+    back = list(load_workload(path))
+    assert back[0] == {"pid": 1, "kind": "cpu"}
+    assert back[1] == specs[1]
+
+
+def test_read_trace_skips_comments_and_blanks(tmp_path):
+    path = tmp_path / "t.jsonl"
+    path.write_text('# header\n\n{"pid":1,"kind":"io"}\n')
+    assert list(read_trace(str(path))) == [{"pid": 1, "kind": "io"}]
+
+
+def test_feed_arrival_and_departure():
+    feed = WorkloadFeed([
+        {"pid": 1, "kind": "cpu"},
+        {"pid": 2, "kind": "io", "arrival": 1.0, "departure": 3.0},
+    ])
+    arrived, departed = feed.advance(0.0)
+    assert [p.pid for p in arrived] == [1] and departed == []
+
+    arrived, departed = feed.advance(1.0)
+    assert [p.pid for p in arrived] == [2] and departed == []
+
+    arrived, departed = feed.advance(3.0)
+    assert arrived == [] and [p.pid for p in departed] == [2]
+    assert departed[0].completed
+    assert not feed.exhausted()  # pid 1 never departs
+
+
+def test_feed_skips_process_living_within_one_step():
+    feed = WorkloadFeed([
+        {"pid": 1, "kind": "io", "arrival": 0.1, "departure": 0.2},
+        {"pid": 2, "kind": "io", "arrival": 0.3, "departure": 5.0},
+    ])
+    arrived, departed = feed.advance(1.0)
+    assert [p.pid for p in arrived] == [2] and departed == []
+    assert 1 not in feed.active
+
+
+def test_feed_exhausted_after_last_departure():
+    feed = WorkloadFeed([{"pid": 1, "kind": "io", "departure": 1.0}])
+    feed.advance(0.0)
+    assert not feed.exhausted()
+    feed.advance(1.0)
+    assert feed.exhausted()
+
+
+def test_feed_switches_phases():
+    feed = WorkloadFeed([
+        {"pid": 1, "kind": "mem", "arrival": 1.0,
+         "phases": [{"at": 2.0, "kind": "io", "mem_demand_mb": 5},
+                    {"at": 0.5, "kind": "cpu"}]},
+    ])
+    (p,), _ = feed.advance(1.0)
+    assert p.kind == "mem"
+    feed.advance(1.5)           # age 0.5
+    assert p.kind == "cpu"
+    feed.advance(3.0)           # age 2.0
+    assert p.kind == "io" and p.mem_demand_mb == 5
+
+
+def test_feed_rejects_unsorted_trace(tmp_path):
+    path = tmp_path / "t.jsonl"
+    path.write_text(
+        '{"pid":1,"kind":"io","arrival":0}\n'
+        '{"pid":2,"kind":"io","arrival":2}\n'
+        '# late\n'
+        '{"pid":3,"kind":"io","arrival":1}\n'
+    )
+    feed = WorkloadFeed(load_workload(str(path)))
+    feed.advance(0.0)
+    with pytest.raises(ValueError, match=r"pid 3 at line 4"):
+        feed.advance(2.0)
+
+
+def test_workload_name_strips_trace_extensions():
+    assert workload_name("results/trace_100k.jsonl.gz") == "trace_100k"
+    assert workload_name("t.jsonl") == "t"
+    assert workload_name("workloads/mix1.json") == "mix1"
+
+
+class FakeProcess:
+    def __init__(self, pid):
+        self.pid = pid
+
+    def run_for(self, duration_seconds):
+        return duration_seconds
+
+
+def test_scheduler_remove_keeps_rr_position():
+    sched = RoundRobinScheduler([FakeProcess(i) for i in (1, 2, 3, 4)], slice_sec=0.01)
+    assert sched.step()[0] == 1
+    assert sched.step()[0] == 2
+    sched.remove(1)             # before the cursor: next is still pid 3
+    assert sched.step()[0] == 3
+    sched.remove(4)             # at the cursor and last: wraps to the front
+    assert sched.step()[0] == 2
+    sched.add(FakeProcess(5))
+    assert [sched.step()[0] for _ in range(3)] == [3, 5, 2]
+
+
+def test_scheduler_step_on_empty_queue():
+    sched = RoundRobinScheduler([], slice_sec=0.01)
+    assert sched.step() == (None, 0.0)
+    sched.add(FakeProcess(1))
+    sched.remove(1)
+    assert sched.step() == (None, 0.0)